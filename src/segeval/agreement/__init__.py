@@ -21,6 +21,10 @@ AGREEMENT_METRIC_DEFAULTS.update({
 
 
 def __fnc_metric__(fnc_metric, dataset, **kwargs):
+    # Coefficients are reduced from every coder pair at once, serially
+    if 'n_jobs' in kwargs:
+        raise SegmentationMetricError(
+            'n_jobs is not supported by agreement coefficients')
     metric_kwargs = dict(AGREEMENT_METRIC_DEFAULTS)
     metric_kwargs.update(kwargs)
     if hasattr(dataset, 'boundary_types'):
@@ -30,6 +34,27 @@ def __fnc_metric__(fnc_metric, dataset, **kwargs):
     return fnc_metric(dataset, **metric_kwargs)
 
 
+def __check_dataset__(dataset, min_coders=None):
+    '''
+    Check that each item in a dataset has been coded by the same number of
+    coders, and optionally by at least ``min_coders`` coders.
+
+    :returns: Number of coders per item.
+    :rtype: int
+    '''
+    items_coders = dataset.values()
+    first_coders = next(iter(items_coders), None)
+    # Check that there are enough coders
+    if min_coders is not None and \
+            any(len(coder_segs) < min_coders for coder_segs in items_coders):
+        raise Exception('Less than {0} coders specified.'.format(min_coders))
+    # Check that there are an identical number of items
+    if first_coders is None or \
+            any(len(coder_segs) != len(first_coders) for coder_segs in items_coders):
+        raise Exception('Unequal number of items contained.')
+    return len(first_coders)
+
+
 def __potential_boundaries__(segmentation_a, segmentation_b, **kwargs):
     boundary_format = kwargs['boundary_format']
     boundary_string_a = segmentation_a
@@ -144,6 +169,8 @@ def __actual_agreement_linear__(dataset, **kwargs):
     all_denominators = list()
     all_pbs = list()
     coders_boundaries = dict()
+    # Boundaries per item and coder; each coding takes part in many pairs
+    item_coder_boundaries = dict()
     # Obtain the list of coders
     coders = list(get_coders(dataset))
     # For each permutation of coders
@@ -167,8 +194,12 @@ def __actual_agreement_linear__(dataset, **kwargs):
                 if coders[n] not in coders_boundaries:
                     coders_boundaries[coders[n]] = list()
                 # Add per-coder values to dicts
-                coders_boundaries[coders[m]].append([__boundaries__(segs_a, **metric_kwargs), pbs])
-                coders_boundaries[coders[n]].append([__boundaries__(segs_b, **metric_kwargs), pbs])
+                for coder, segs in ((coders[m], segs_a), (coders[n], segs_b)):
+                    if (item, coder) not in item_coder_boundaries:
+                        item_coder_boundaries[(item, coder)] = \
+                            __boundaries__(segs, **metric_kwargs)
+                    coders_boundaries[coder].append(
+                        [item_coder_boundaries[(item, coder)], pbs])
     if return_parts:
         return all_numerators, all_denominators, all_pbs, coders_boundaries
     else:
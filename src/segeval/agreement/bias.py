@@ -4,9 +4,10 @@ Arstein Poesio's annotator bias [ArtsteinPoesio2008]_.
 .. moduleauthor:: Chris Fournier <chris.m.fournier@gmail.com>
 '''
 from __future__ import absolute_import
-from segeval.agreement import __fnc_metric__
-from segeval.agreement.kappa import __fleiss_kappa_linear__
-from segeval.agreement.pi import __fleiss_pi_linear__
+from segeval.agreement import (__fnc_metric__, __actual_agreement_linear__,
+                               __check_dataset__)
+from segeval.agreement.kappa import __kappa_reduce__
+from segeval.agreement.pi import __pi_reduce__
 
 
 def __artstein_poesio_bias_linear__(dataset, **kwargs):
@@ -17,9 +18,15 @@ def __artstein_poesio_bias_linear__(dataset, **kwargs):
     metric_kwargs['return_parts'] = True
     # Arguments
     return_parts = kwargs['return_parts']
-    # Compute
-    A_pi_e = __fleiss_pi_linear__(dataset, **metric_kwargs)[1]
-    A_fleiss_e = __fleiss_kappa_linear__(dataset, **metric_kwargs)[1]
+    __check_dataset__(dataset, min_coders=2)
+    # Compute actual agreement parts once and share them between both
+    # expected agreement calculations
+    all_numerators, all_denominators, _, coders_boundaries = \
+        __actual_agreement_linear__(dataset, **metric_kwargs)
+    A_pi_e = __pi_reduce__(all_numerators, all_denominators,
+                           coders_boundaries)[1]
+    A_fleiss_e = __kappa_reduce__(all_numerators, all_denominators,
+                                  coders_boundaries)[1]
     bias = A_pi_e - A_fleiss_e
     # Return
     if return_parts:
@@ -5,31 +5,17 @@ Inter-coder agreement statistic Fleiss' Kappa.
 '''
 from __future__ import absolute_import, division
 from decimal import Decimal
-from segeval.agreement import __fnc_metric__, __actual_agreement_linear__
+from segeval.agreement import (__fnc_metric__, __actual_agreement_linear__,
+                               __check_dataset__)
 
 
-def __fleiss_kappa_linear__(dataset, **kwargs):
+def __kappa_reduce__(numerators, denominators, coders_boundaries):
     '''
-    Calculates Fleiss' :math:`\kappa` (or multi-:math:`\kappa`), originally proposed in
-    [DaviesFleiss1982]_.  For 2 coders, this is equivalent to Cohen's :math:`\kappa`
-    [Cohen1960]_.
+    Reduce per-pair similarity parts and per-coder boundary counts into actual
+    (:math:`\\text{A}_a`) and expected (:math:`\\text{A}_e`) agreement.
     '''
-    metric_kwargs = dict(kwargs)
-    metric_kwargs['return_parts'] = True
-    # Arguments
-    return_parts = kwargs['return_parts']
-    # Check that there are more than 2 coders
-    if len([True for coder_segs in dataset.values()
-            if len(coder_segs.keys()) < 2]) > 0:
-        raise Exception('Less than 2 coders specified.')
-    # Check that there are an identical number of items
-    if len(set([len(coder_segs.values()) for coder_segs in dataset.values()])) != 1:
-        raise Exception('Unequal number of items contained.')
-    # Initialize totals
-    all_numerators, all_denominators, _, coders_boundaries = \
-        __actual_agreement_linear__(dataset, **metric_kwargs)
     # Calculate Aa
-    A_a = Decimal(sum(all_numerators)) / sum(all_denominators)
+    A_a = Decimal(sum(numerators)) / sum(denominators)
     # Calculate Ae
     coders = list(coders_boundaries.keys())
     P_segs = list()
@@ -47,6 +33,26 @@ def __fleiss_kappa_linear__(dataset, **kwargs):
                           (Decimal(boundaries_n) / total_boundaries_n))
     P_seg = Decimal(sum(P_segs)) / len(P_segs)
     A_e = P_seg
+    return A_a, A_e
+
+
+def __fleiss_kappa_linear__(dataset, **kwargs):
+    '''
+    Calculates Fleiss' :math:`\kappa` (or multi-:math:`\kappa`), originally proposed in
+    [DaviesFleiss1982]_.  For 2 coders, this is equivalent to Cohen's :math:`\kappa`
+    [Cohen1960]_.
+    '''
+    metric_kwargs = dict(kwargs)
+    metric_kwargs['return_parts'] = True
+    # Arguments
+    return_parts = kwargs['return_parts']
+    __check_dataset__(dataset, min_coders=2)
+    # Initialize totals
+    all_numerators, all_denominators, _, coders_boundaries = \
+        __actual_agreement_linear__(dataset, **metric_kwargs)
+    # Calculate Aa and Ae
+    A_a, A_e = __kappa_reduce__(all_numerators, all_denominators,
+                                coders_boundaries)
     # Calculate pi
     kappa = (A_a - A_e) / (Decimal('1') - A_e)
     # Return
@@ -5,7 +5,25 @@ Inter-coder agreement statistic Fleiss' Pi.
 '''
 from __future__ import absolute_import, division
 from decimal import Decimal
-from segeval.agreement import __fnc_metric__, __actual_agreement_linear__
+from segeval.agreement import (__fnc_metric__, __actual_agreement_linear__,
+                               __check_dataset__)
+
+
+def __pi_reduce__(numerators, denominators, coders_boundaries):
+    '''
+    Reduce per-pair similarity parts and per-coder boundary counts into actual
+    (:math:`\\text{A}_a`) and expected (:math:`\\text{A}_e`) agreement,
+    visiting each per-coder ``[boundaries, total_boundaries]`` entry once.
+    '''
+    A_a = Decimal(sum(numerators)) / sum(denominators)
+    summation = Decimal(0)
+    count = 0
+    for boundaries_info in coders_boundaries.values():
+        for boundaries, total_boundaries in boundaries_info:
+            summation += Decimal(boundaries) / total_boundaries
+        count += len(boundaries_info)
+    P_e_seg = summation / count
+    return A_a, P_e_seg ** 2
 
 
 def __fleiss_pi_linear__(dataset, **kwargs):
@@ -19,24 +37,13 @@ def __fleiss_pi_linear__(dataset, **kwargs):
     metric_kwargs['return_parts'] = True
     # Arguments
     return_parts = kwargs['return_parts']
-    # Check that there are an equal number of items for each coder
-    if len(set([len(coder_segs.values()) for coder_segs in dataset.values()])) != 1:
-        raise Exception('Unequal number of items contained.')
+    __check_dataset__(dataset)
     # Initialize totals
     all_numerators, all_denominators, _, coders_boundaries = \
         __actual_agreement_linear__(dataset, **metric_kwargs)
-    # Calculate Aa
-    A_a = Decimal(sum(all_numerators)) / sum(all_denominators)
-    # Calculate Ae
-    p_e_segs = list()
-    for boundaries_info in coders_boundaries.values():
-        for item in boundaries_info:
-            boundaries, total_boundaries = item
-            p_e_seg = Decimal(boundaries) / total_boundaries
-            p_e_segs.append(p_e_seg)
-    # Calculate P_e_seg
-    P_e_seg = Decimal(sum(p_e_segs)) / len(p_e_segs)
-    A_e = (P_e_seg ** 2)
+    # Calculate Aa and Ae
+    A_a, A_e = __pi_reduce__(all_numerators, all_denominators,
+                             coders_boundaries)
     # Calculate pi
     pi = (A_a - A_e) / (Decimal('1') - A_e)
     # Return
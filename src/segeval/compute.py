@@ -4,6 +4,10 @@ Abstract computation utilities.
 .. moduleauthor:: Chris Fournier <chris.m.fournier@gmail.com>
 '''
 from __future__ import absolute_import
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from segeval.util import SegmentationMetricError
 from segeval.util.math import mean, std, var, stderr
 from itertools import combinations
 
@@ -17,18 +21,24 @@ def compute_pairwise_values(fnc_metric, dataset_a, dataset_b=None, **kwargs):
                            codings).
     :param fnc_metric:     Metric function to call on segmentation mass pairs.
     :param permuted:       Permute coder combinations if true.
+    :param n_jobs:         Number of worker processes used to compare coder \
+                           pairs (default is 1, i.e., serially).
     :type dataset: dict
     :type fnc_metric:     func
     :type permuted:       bool
+    :type n_jobs:         int
     '''
 
     pairs = dict()
     fnc_kwargs = dict(kwargs)
     # Obtain parameters
     permuted = fnc_kwargs['permuted']
-    return_parts = fnc_kwargs['return_parts'] \
-        if 'return_parts' in fnc_kwargs else False
+    n_jobs = fnc_kwargs.pop('n_jobs', 1)
     del fnc_kwargs['permuted']
+    # Coder pairs to compare, in the order that they are reported
+    entries = list()
+    segs_ms = list()
+    segs_ns = list()
 
     # Define fnc per group
     def __per_group__(prefix, inner_dataset_m, inner_dataset_n, has_two_datasets):
@@ -52,8 +62,6 @@ def compute_pairwise_values(fnc_metric, dataset_a, dataset_b=None, **kwargs):
             # Skip this label if it is not contained within both datasets
             if has_two_datasets and (coder_masses_m is None or coder_masses_n is None):
                 continue
-            # Check to see if there is further nesting
-            label_pairs = dict()
             # If is a group
             coder_pairs = None
             if has_two_datasets:
@@ -70,32 +78,37 @@ def compute_pairwise_values(fnc_metric, dataset_a, dataset_b=None, **kwargs):
                 segs_n = coder_masses_n[n]
                 entry_parts = list(prefix)
                 entry_parts.extend([label, str(m), str(n)])
-                entry = ','.join(entry_parts)
-                if return_parts:
-                    label_pairs[entry] = fnc_metric(segs_m, segs_n,
-                                                    **fnc_kwargs)
-                else:
-                    label_pairs[entry] = fnc_metric(segs_m, segs_n,
-                                                    **fnc_kwargs)
+                entries.append(','.join(entry_parts))
+                segs_ms.append(segs_m)
+                segs_ns.append(segs_n)
                 # Handle permutation
                 if permuted and not has_two_datasets:
                     entry_parts = list(prefix)
                     entry_parts.extend([label, str(n), str(m)])
-                    entry = ','.join(entry_parts)
-                    if return_parts:
-                        label_pairs[entry] = \
-                            fnc_metric(segs_n, segs_m, **fnc_kwargs)
-                    else:
-                        label_pairs[entry] = fnc_metric(segs_n, segs_m,
-                                                        **fnc_kwargs)
-            # Add all
-            for entry, pair in label_pairs.items():
-                pairs[entry] = pair
-            # Erase
-            label_pairs = dict()
+                    entries.append(','.join(entry_parts))
+                    segs_ms.append(segs_n)
+                    segs_ns.append(segs_m)
     # Parse
     has_two_datasets = dataset_b is not None
     __per_group__(tuple(), dataset_a, dataset_b, has_two_datasets)
+    # Compute each pair, optionally spread across worker processes
+    fnc_pair = partial(fnc_metric, **fnc_kwargs)
+    if n_jobs > 1 and len(entries) > 1:
+        # Worker processes can only receive picklable metric arguments
+        try:
+            pickle.dumps(fnc_pair)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise SegmentationMetricError(
+                'n_jobs > 1 requires picklable metric arguments (e.g., '
+                'module-level functions rather than lambdas); {0}'.format(error))
+        chunksize = max(1, len(entries) // (4 * n_jobs))
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            values = list(executor.map(fnc_pair, segs_ms, segs_ns,
+                                       chunksize=chunksize))
+    else:
+        values = list(map(fnc_pair, segs_ms, segs_ns))
+    for entry, value in zip(entries, values):
+        pairs[entry] = value
     # Return mean, std dev, and variance
     return pairs
 
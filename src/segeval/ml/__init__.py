@@ -238,6 +238,20 @@ class ConfusionMatrix(dict):
             value = dict.__getitem__(self, key)
         return value
 
+    def __reduce__(self):
+        '''
+        Pickle as plain nested dicts, because item assignment is disabled and
+        inner dicts reference their parent.
+        '''
+        return (self.__class__, (),
+                dict((predicted, dict(values)) for predicted, values in self.items()))
+
+    def __setstate__(self, state):
+        for predicted, values in state.items():
+            inner = self[predicted]
+            for actual, count in values.items():
+                inner[actual] = count
+
     def classes(self):
         '''
         Retrieve the set of all classes.
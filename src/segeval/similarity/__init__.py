@@ -58,22 +58,31 @@ def __boundary_statistics__(
     # Compute edits
     additions, substitutions, transpositions = \
         boundary_edit_distance(segs_a, segs_b, n_t=n_t)
+    # Bound the ordinal boundary types; a single boundary type admits no
+    # substitutions, so skip scanning for the extremes
+    if len(boundary_types) == 1:
+        max_type = min_type = next(iter(boundary_types))
+    else:
+        max_type, min_type = max(boundary_types), min(boundary_types)
     # Apply weighting functions
     fnc_weight_a, fnc_weight_s, fnc_weight_t = weight
     count_additions = fnc_weight_a(additions)
-    count_substitutions = fnc_weight_s(substitutions,
-                                       max(boundary_types),
-                                       min(boundary_types))
+    count_substitutions = fnc_weight_s(substitutions, max_type, min_type)
     count_transpositions = fnc_weight_t(transpositions, n_t)
     count_edits = count_additions + count_substitutions + count_transpositions
     # Compute
     matches = list()
     full_misses = list()
-    boundaries_all = 0
+    boundaries_all = sum(map(len, segs_a)) + sum(map(len, segs_b))
     for set_a, set_b in zip(segs_a, segs_b):
-        matches.extend(set_a.intersection(set_b))
-        full_misses.extend(set_a.symmetric_difference(set_b))
-        boundaries_all += len(set_a) + len(set_b)
+        # Most positions in sparse segmentations hold no boundaries
+        if not set_a and not set_b:
+            continue
+        if set_a == set_b:
+            matches.extend(set_a)
+        else:
+            matches.extend(set_a & set_b)
+            full_misses.extend(set_a ^ set_b)
     return {'count_edits': count_edits, 'additions': additions,
             'substitutions': substitutions, 'transpositions': transpositions,
             'full_misses': full_misses, 'boundaries_all': boundaries_all,
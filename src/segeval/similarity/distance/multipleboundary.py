@@ -5,8 +5,8 @@ Multiple-boundary edit distance.
 '''
 from __future__ import absolute_import, annotations, division
 
-from itertools import permutations
 from collections import namedtuple
+from functools import lru_cache
 
 
 Addition = namedtuple('Addition', 'type side')  # For side; a = from a, b = from b
@@ -14,6 +14,8 @@ Substitution = namedtuple('Substitution', 'type_a type_b')
 Transposition = namedtuple('Transposition', 'start end type')
 Difference = namedtuple('Difference', 'sim a_b b_a')
 
+_EMPTY = frozenset()
+
 
 def additions_substitutions(d: set, a: set, b: set):
     '''
@@ -65,67 +67,95 @@ def additions_substitutions_sets(d: set, a: set, b: set) -> tuple[list, set]:
     ([(2, 'a'), (3, 'a')], set([(4, 6)]))
     '''
 
-    substitutions = list()
-    delta = None
-    for perm_a in permutations(sorted(a)):
-        for perm_b in permutations(sorted(b)):
-            current_substitutions = zip(perm_a, perm_b)
-            current_substitutions = set(current_substitutions)
-            current_delta = sum(abs(a_i - b_i)
-                                for a_i, b_i in current_substitutions)
-            if delta is None or current_delta < delta:
-                delta = current_delta
-                substitutions = current_substitutions
-    # Collect all substitutions
-    substituted = list()
-    added = list()
-    for a_i, b_i in substitutions:
-        substituted.append(a_i)
-        substituted.append(b_i)
-    additions = d - set(substituted)
-    # Add from a
-    for addition in a - set(substituted):
-        added.append(Addition(addition, 'a'))
-    # Add from b
-    for addition in b - set(substituted):
-        added.append(Addition(addition, 'b'))
-    assert len(added) is len(additions)
-    return added, set([Substitution(a_i, b_i) for a_i, b_i in set(substitutions)])
-
-
-def __has_substitutions__(i: int, j: int, d, options_set):
+    added, substitutions = __additions_substitutions_sets__(frozenset(a), frozenset(b))
+    assert len(added) + 2 * len(substitutions) == len(d)
+    return list(added), set(substitutions)
+
+
+@lru_cache(maxsize=4096)
+def __additions_substitutions_sets__(a: frozenset, b: frozenset) -> tuple[tuple, frozenset]:
     '''
-    Determine whether two substitutions are present involving the boundary 'd'
-    at the positions 'i' and 'j'.
+    Compute the additions and substitutions for a pair of differences, caching
+    them because the same disagreements (e.g., {1} and {2}) recur across
+    positions and boundary string pairs.
     '''
 
-    present = False
-    if i in options_set and d in options_set[i][0] and j in options_set and d in options_set[j][0]:
-        d_i, a_i, b_i = options_set[i]
-        d_j, a_j, b_j = options_set[j]
-        if (additions_substitutions(d_i, a_i, b_i)[1] > 0 and
-            additions_substitutions(d_j, a_j, b_j)[1] > 0):
-            present = True
-    return present
+    # Without types on both sides, every difference is an addition
+    if not a or not b:
+        return tuple(Addition(x, 'a') for x in a) + tuple(Addition(x, 'b') for x in b), frozenset()
+    sa = sorted(a)
+    sb = sorted(b)
+    if len(sa) == len(sb):
+        # Pairing in sorted order is an optimal L1 assignment on a line
+        substitutions = set(zip(sa, sb))
+    else:
+        big, small = (sa, sb) if len(sa) > len(sb) else (sb, sa)
+        n_big, n_small = len(big), len(small)
+        if n_small == 1:
+            # A single type pairs with its nearest counterpart
+            small_i = small[0]
+            pairs = [(min(big, key=lambda big_i: abs(big_i - small_i)),
+                      small_i)]
+        else:
+            # Minimum cost of pairing small[j:] in order within big[i:], kept
+            # one row at a time with a bit per cell recording a pairing
+            taken = bytearray((n_big * n_small + 7) // 8)
+            prev = [0] * (n_small + 1)
+            for i in range(n_big - 1, -1, -1):
+                curr = [0] * (n_small + 1)
+                # Cells needing more of small than big has left are skipped
+                first_j = max(0, n_small - (n_big - i))
+                for j in range(n_small - 1, first_j - 1, -1):
+                    take = prev[j + 1] + abs(big[i] - small[j])
+                    # Skipping big[i] is only possible with enough of big left
+                    if n_big - i - 1 >= n_small - j and prev[j] < take:
+                        curr[j] = prev[j]
+                    else:
+                        curr[j] = take
+                        cell = i * n_small + j
+                        taken[cell >> 3] |= 1 << (cell & 7)
+                prev = curr
+            # Recover the pairing, preferring earlier types of big on ties
+            pairs = list()
+            i = j = 0
+            while j < n_small:
+                cell = i * n_small + j
+                if taken[cell >> 3] >> (cell & 7) & 1:
+                    pairs.append((big[i], small[j]))
+                    j += 1
+                i += 1
+        if big is sb:
+            pairs = [(small_i, big_i) for big_i, small_i in pairs]
+        substitutions = set(pairs)
+    # Collect all substituted types
+    matched = {x for pair in substitutions for x in pair}
+    # Add from a, then from b
+    added = tuple(Addition(x, 'a') for x in a - matched) + \
+        tuple(Addition(x, 'b') for x in b - matched)
+    return added, frozenset(Substitution(a_i, b_i) for a_i, b_i in substitutions)
+
+
+def __substitution_count__(difference: Difference) -> int:
+    '''
+    Count the substitutions possible at a position; each pairs a boundary type
+    only in A with one only in B.
+    '''
+
+    return min(len(difference.a_b), len(difference.b_a))
 
 
-def __overlaps_existing__(i: int, j: int, d, options_transp):
+def __has_substitutions__(i: int, j: int, d, options_set, sub_count=None):
     '''
-    Determine whether a transposition would overlap another that has been
-    previously identified involving the boundary 'd' at the positions 'i' and
-    'j'.
+    Determine whether two substitutions are present involving the boundary 'd'
+    at the positions 'i' and 'j'.
     '''
 
-    def check_position(position):
-        '''
-        Check a position for an overlapping transposition
-        '''
-        if position in options_transp:
-            for t in options_transp[position]:
-                # If the transposition 't' is of the boundary type 'd'
-                if t[2] is d:
-                    return True
-    return check_position(i) or check_position(j)
+    present = False
+    if i in options_set and d in options_set[i][0] and j in options_set and d in options_set[j][0]:
+        if sub_count is None:
+            sub_count = {k: __substitution_count__(options_set[k]) for k in (i, j)}
+        present = sub_count[i] > 0 and sub_count[j] > 0
+    return present
 
 
 def find_transpositions(boundary_string_a: list[frozenset], boundary_string_b: list[frozenset],
@@ -138,56 +168,65 @@ def find_transpositions(boundary_string_a: list[frozenset], boundary_string_b: l
     Algorithm 4.3 from Fournier 2013.
     '''
 
-    options_transp: dict[Transposition] = dict()  # stored transitions :math:`O_T` that we check
+    options_transp: dict[int, set] = dict()  # types of stored transpositions :math:`O_T` by position
     transpositions = list()
+    sub_count = {i: __substitution_count__(v) for i, v in options_set.items()}
+    # Symmetric differences per position do not change between spans
+    diff_ab = [a_i ^ b_i for a_i, b_i in zip(boundary_string_a, boundary_string_b)]
+    # Only positions that differ can start or end a transposition
+    diff_positions = [i for i, diff_i in enumerate(diff_ab) if diff_i]
     for n_i in sorted(n_t):
         n_i = n_i - 1
-        for i in range(0, len(boundary_string_a) - n_i):
+        for i in diff_positions:
             j = i + n_i
-
-            # Select edge sets
-            a_i: frozenset = boundary_string_a[i]
-            a_j: frozenset = boundary_string_a[j]
-            b_i: frozenset = boundary_string_b[i]
-            b_j: frozenset = boundary_string_b[j]
+            if j >= len(diff_ab):
+                break
+            diff_i = diff_ab[i]
+            diff_j = diff_ab[j]
+            if not diff_j:
+                continue
 
             # Compute symmetric differences
-            diff_i = a_i ^ b_i
-            diff_j = a_j ^ b_j
-            diff_a = a_i ^ a_j
-            diff_b = b_i ^ b_j
+            diff_a = boundary_string_a[i] ^ boundary_string_a[j]
+            diff_b = boundary_string_b[i] ^ boundary_string_b[j]
 
             # Detect potential transposition
             t_p = diff_i & diff_j & diff_a & diff_b
+            if not t_p:
+                continue
+
+            # Types already covered by a transposition at either position
+            covered_i = options_transp.get(i, _EMPTY)
+            covered_j = options_transp.get(j, _EMPTY)
 
             # Apply each transposition found by boundary type
             for d in t_p:
-                # Create transposition representation
-                option_transp = Transposition(i, j, d)
-
                 # Check to see that it does not overlap an existing
-                # transposition and that 2 substitutions are not removed
-                if (not __overlaps_existing__(i, j, d, options_transp) and
-                    not __has_substitutions__(i, j, d, options_set)):
-
-                    # Add
-                    transpositions.append(option_transp)
-
-                    # Record positions covered
-                    if i not in options_transp:
-                        options_transp[i] = list()
-                    if j not in options_transp:
-                        options_transp[j] = list()
-                    options_transp[i].append(option_transp)
-                    options_transp[j].append(option_transp)
-
-                    # Removing potential set errors that overlap
-                    options_set[i][0].discard(d)
-                    options_set[i][1].discard(d)
-                    options_set[i][2].discard(d)
-                    options_set[j][0].discard(d)
-                    options_set[j][1].discard(d)
-                    options_set[j][2].discard(d)
+                # transposition (the cheaper check) and that 2 substitutions
+                # are not removed
+                if d in covered_i or d in covered_j or \
+                        __has_substitutions__(i, j, d, options_set, sub_count):
+                    continue
+
+                # Add
+                transpositions.append(Transposition(i, j, d))
+
+                # Record positions covered
+                options_transp.setdefault(i, set()).add(d)
+                options_transp.setdefault(j, set()).add(d)
+
+                # Removing potential set errors that overlap
+                for position in (i, j):
+                    option_set = options_set[position]
+                    d_p, a_p, b_p = option_set
+                    d_p.discard(d)
+                    a_p.discard(d)
+                    b_p.discard(d)
+                    if d_p:
+                        sub_count[position] = __substitution_count__(option_set)
+                    else:
+                        # Every type here is now covered by a transposition
+                        del options_set[position]
 
     return transpositions
 
@@ -204,12 +243,10 @@ def optional_set_edits(
     options_set = dict()
     for i, value in enumerate(zip(boundary_string_a, boundary_string_b)):
         a_i, b_i = value
-        a = set(a_i - b_i)
-        b = set(b_i - a_i)
-        d = set(a_i ^ b_i)
-        # Record additions/deletions
-        if len(d) > 0:
-            options_set[i] = Difference(d, a, b)
+        d = a_i ^ b_i
+        # Record additions/deletions; most positions agree and are skipped
+        if d:
+            options_set[i] = Difference(set(d), set(a_i - b_i), set(b_i - a_i))
     return options_set
 
 
@@ -238,6 +275,9 @@ def boundary_edit_distance(boundary_string_a: list[frozenset], boundary_string_b
     :type boundary_string_b:  tuple
     :type n_t:  int
     '''
+    # Identical boundary strings (e.g., complete agreement) need no edits
+    if boundary_string_a == boundary_string_b:
+        return list(), list(), list()
     n_t = range(2, n_t + 1)
     # Find potential addition/deletion/substitution operations
     options_set = optional_set_edits(boundary_string_a, boundary_string_b)
@@ -41,7 +41,6 @@ def weight_t_scale(transpositions, max_n):
     '''
     Default weighting function for transposition edit operations by the distance that transpositions span.
     '''
-    numerator = 0
-    for transposition in transpositions:
-        numerator += abs(transposition[0] - transposition[1])
+    numerator = sum(abs(transposition[0] - transposition[1])
+                    for transposition in transpositions)
     return Decimal(numerator) / max_n
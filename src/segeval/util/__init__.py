@@ -79,6 +79,7 @@ def __fnc_metric__(fnc_metric, args, kwargs, kw_defaults):
         else:
             # Compare a single pair of segmentations
             del metric_kwargs['permuted']
+            metric_kwargs.pop('n_jobs', None)
             return fnc_metric(hypothesis, reference, **metric_kwargs)
     # Except if insufficient arguments supplied
     raise SegmentationMetricError('Incorrect arguments specified; expected 1 or 2, obtained {0} of value: {1}'.format(str(len(args)), str(args)))
@@ -26,36 +26,57 @@ class TestCase(unittest.TestCase):
         Automatically converts values to floats.
         '''
 
-        if isinstance(first, dict) and isinstance(second, dict):
-            for item in set(list(first.keys()) + list(second.keys())):
+        # Pairs left to compare; a container's message is only formatted
+        # should one of its values fail to compare
+        work = [(first, second, msg)]
+        while work:
+            first, second, msg = work.pop()
+            if isinstance(first, dict) and isinstance(second, dict):
                 if not msg:
-                    msg = '{0} != {1}'.format(first, second)
-                if item not in first:
+                    msg = self.__lazy_msg__(first, second)
+                items = list()
+                for item in set(list(first.keys()) + list(second.keys())):
+                    if item not in first:
+                        raise Exception(
+                            '{0} not in {1}; expected {2}'.format(item, first,
+                                                                  second))
+                    if item not in second:
+                        raise Exception(
+                            '{0} not in {1}; expected {2}'.format(item, second,
+                                                                  first))
+                    items.append((first[item], second[item], msg))
+                work.extend(reversed(items))
+            elif (isinstance(first, list) or isinstance(first, tuple)) and \
+                    (isinstance(second, list) or isinstance(second, tuple)):
+                if len(first) != len(second):
                     raise Exception(
-                        '{0} not in {1}; expected {2}'.format(item, first,
-                                                              second))
-                if item not in second:
-                    raise Exception(
-                        '{0} not in {1}; expected {2}'.format(item, second,
-                                                              first))
-                self.assertAlmostEquals(first[item], second[item], places, msg)
-        elif (isinstance(first, list) or isinstance(first, tuple)) and \
-                (isinstance(second, list) or isinstance(second, tuple)):
-            if len(first) != len(second):
-                raise Exception(
-                    'Size mismatch; {0} != {1}'.format(first, second))
-            for item in zip(first, second):
+                        'Size mismatch; {0} != {1}'.format(first, second))
                 if not msg:
-                    msg = '{0} != {1}'.format(first, second)
-                self.assertAlmostEquals(item[0], item[1], places, msg)
-        elif not isinstance(first, type(second)):
-            if not isinstance(first, float) and not isinstance(first, Decimal) and \
-                    not isinstance(second, float) and not isinstance(second, Decimal):
-                raise Exception('Type mismatch; {0} != {1}'.format(
-                    type(first), type(second)))
-        else:
-            return unittest.TestCase.assertAlmostEquals(self,
-                                                        float(first),
-                                                        float(second),
-                                                        places=places,
-                                                        msg=msg)
+                    msg = self.__lazy_msg__(first, second)
+                work.extend(reversed([(item[0], item[1], msg)
+                                      for item in zip(first, second)]))
+            elif not isinstance(first, type(second)):
+                if not isinstance(first, float) and not isinstance(first, Decimal) and \
+                        not isinstance(second, float) and not isinstance(second, Decimal):
+                    raise Exception('Type mismatch; {0} != {1}'.format(
+                        type(first), type(second)))
+            else:
+                first, second = float(first), float(second)
+                try:
+                    unittest.TestCase.assertAlmostEqual(self, first, second,
+                                                        places=places)
+                    continue
+                except self.failureException:
+                    pass
+                # Repeat the failing comparison with the container's message
+                if callable(msg):
+                    msg = msg()
+                unittest.TestCase.assertAlmostEqual(self, first, second,
+                                                    places=places, msg=msg)
+
+    @staticmethod
+    def __lazy_msg__(first, second):
+        '''
+        Defer formatting a failure message for a pair of containers.
+        '''
+        return lambda: '{0} != {1}'.format(first, second)
@@ -36,22 +36,15 @@ def __pk__(hypothesis, reference, window_size, one_minus, boundary_format,
     if window_size is None:
         window_size = __compute_window_size__(reference, fnc_round,
                                               BoundaryFormat.position)
-    # Create a set of pairs of units from each segmentation to go over using a
-    # window
+    # Probe agreement at both ends of each window with k boundaries inside;
+    # comparing the two ends directly avoids slicing every window
     sum_differences = 0
-    # Slide window over and sum the number of varying windows
-    measurements = 0
-    for i in range(0, len(reference) - (window_size)):
-        # Create probe windows with k boundaries inside
-        window_ref = reference[i:i + window_size + 1]
-        window_hyp = hypothesis[i:i + window_size + 1]
-        # Probe agreement
-        agree_ref = window_ref[0] is window_ref[-1]
-        agree_hyp = window_hyp[0] is window_hyp[-1]
-        # If the windows agreements agree
-        if agree_ref is not agree_hyp:
+    for ref_i, ref_k, hyp_i, hyp_k in zip(reference, reference[window_size:],
+                                          hypothesis, hypothesis[window_size:]):
+        # If the windows agreements disagree
+        if (ref_i == ref_k) is not (hyp_i == hyp_k):
             sum_differences += 1
-        measurements += 1
+    measurements = max(0, len(reference) - window_size)
     # Perform final division
     value = Decimal(sum_differences) / measurements if measurements > 0 else 0
     if return_parts:
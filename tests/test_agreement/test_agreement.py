@@ -5,10 +5,12 @@ Tests actual agreement.
 '''
 from __future__ import absolute_import
 import unittest
+from unittest import mock
 from decimal import Decimal
 from segeval.agreement import (actual_agreement_linear,
                                __potential_boundaries__,
-                               __boundaries__, BoundaryFormat)
+                               __boundaries__, __check_dataset__,
+                               BoundaryFormat)
 from segeval.util import SegmentationMetricError
 from segeval.data.samples import (KAZANTSEVA2012_G5, KAZANTSEVA2012_G2,
                                   COMPLETE_AGREEMENT, LARGE_DISAGREEMENT)
@@ -195,3 +197,32 @@ class TestAgreement(unittest.TestCase):
             __boundaries__,
             '0010',
             **kwargs)
+
+    def test_check_dataset(self):
+        '''
+        Test dataset validation shared by the agreement coefficients.
+        '''
+        data = {'i1': {'c1': [2, 8, 2, 1], 'c2': [2, 8, 2, 1]},
+                'i2': {'c1': [2, 8, 2, 1], 'c2': [2, 1, 7, 2, 1]}}
+        self.assertEqual(2, __check_dataset__(data, min_coders=2))
+        self.assertRaises(Exception, __check_dataset__,
+                          {'i1': {'c1': [2, 8, 2, 1]}}, min_coders=2)
+        self.assertRaises(Exception, __check_dataset__, {})
+
+    def test_boundaries_per_coding(self):
+        '''
+        Test that boundaries are counted once per item and coder, rather than
+        once per coder pair.
+        '''
+        with mock.patch('segeval.agreement.__boundaries__',
+                        wraps=__boundaries__) as boundaries:
+            actual_agreement_linear(KAZANTSEVA2012_G5)
+        codings = sum(len(coders) for coders in KAZANTSEVA2012_G5.values())
+        self.assertEqual(codings, boundaries.call_count)
+
+    def test_n_jobs_unsupported(self):
+        '''
+        Test that n_jobs is rejected rather than silently ignored.
+        '''
+        self.assertRaises(SegmentationMetricError, actual_agreement_linear,
+                          KAZANTSEVA2012_G5, n_jobs=2)
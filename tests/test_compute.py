@@ -0,0 +1,30 @@
+'''
+Tests abstract computation utilities.
+
+.. moduleauthor:: Chris Fournier <chris.m.fournier@gmail.com>
+'''
+from __future__ import absolute_import
+import unittest
+from segeval.compute import compute_pairwise_values
+from segeval.similarity.boundary import boundary_similarity
+from segeval.data.samples import KAZANTSEVA2012_G5
+
+
+class TestCompute(unittest.TestCase):
+
+    '''
+    Pairwise computation tests.
+    '''
+
+    def test_compute_pairwise_values_n_jobs(self):
+        '''
+        Test that n_jobs is optional, and that comparing coder pairs in worker
+        processes matches serial comparison.
+        '''
+        serial = compute_pairwise_values(boundary_similarity, KAZANTSEVA2012_G5,
+                                         permuted=False)
+        self.assertEqual(len(serial), 24)
+        self.assertEqual(compute_pairwise_values(boundary_similarity,
+                                                 KAZANTSEVA2012_G5,
+                                                 permuted=False, n_jobs=2),
+                         serial)
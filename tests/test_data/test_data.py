@@ -110,12 +110,12 @@ class TestUtils(unittest.TestCase):
     '''
 
     test_data_dir = pathlib.Path(segeval.data.jsonutils.__file__).parent
+    PARENT_DIR = os.path.abspath(os.path.join(test_data_dir, '..'))
 
     def test_load_nested_folders_dict(self):
         '''
         Test nested folder dict construction.
         '''
-        data_dir = os.path.abspath(os.path.join(self.test_data_dir, '../'))
-        dataset = load_nested_folders_dict(data_dir, FILETYPE_JSON)
+        dataset = load_nested_folders_dict(self.PARENT_DIR, FILETYPE_JSON)
         self.assertEqual(dataset['data,stargazer'],
                          HEARST_1997_STARGAZER['stargazer'])
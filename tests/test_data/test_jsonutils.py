@@ -5,9 +5,10 @@ Tests the data merge functions and package.
 '''
 from __future__ import absolute_import
 
+import json
 import os
 import pathlib
-import re
+import tempfile
 import unittest
 
 import segeval
@@ -25,35 +26,35 @@ class TestJsonUtils(unittest.TestCase):
     '''
 
     test_data_dir = pathlib.Path(segeval.data.jsonutils.__file__).parent
+    HEARST_JSON = os.path.join(test_data_dir, 'hearst1997.json')
+    HEARST_TSV = os.path.join(test_data_dir, 'hearst1997.tsv')
 
     def test_output_linear_mass_json(self):
         '''
         Test ``Dataset.add()``.
         '''
+        file_path_existing = self.HEARST_JSON
         # Output specific file
-        file_path_new = os.path.join(
-            self.test_data_dir, 'hearst1997_test.json')
-        file_path_existing = os.path.join(
-            self.test_data_dir, 'hearst1997.json')
-        output_linear_mass_json(file_path_new, HEARST_1997_STARGAZER)
-        self.assertEqual(re.sub(r'\s+', '', open(file_path_new).read()),
-                         re.sub(r'\s', '', open(file_path_existing).read()))
-        os.remove(file_path_new)
-        self.assertFalse(os.path.exists(file_path_new))
+        fd, file_path_new = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            output_linear_mass_json(file_path_new, HEARST_1997_STARGAZER)
+            with open(file_path_new) as file_new, open(file_path_existing) as file_existing:
+                self.assertEqual(json.load(file_new), json.load(file_existing))
+        finally:
+            os.unlink(file_path_new)
         # Output to folder
-        file_path_new = os.path.join(self.test_data_dir, 'output.json')
-        output_linear_mass_json(self.test_data_dir, HEARST_1997_STARGAZER)
-        self.assertEqual(re.sub(r'\s+', '', open(file_path_new).read()),
-                         re.sub(r'\s', '', open(file_path_existing).read()))
-        os.remove(file_path_new)
-        self.assertFalse(os.path.exists(file_path_new))
+        with tempfile.TemporaryDirectory() as output_dir:
+            file_path_new = os.path.join(output_dir, 'output.json')
+            output_linear_mass_json(output_dir, HEARST_1997_STARGAZER)
+            with open(file_path_new) as file_new, open(file_path_existing) as file_existing:
+                self.assertEqual(json.load(file_new), json.load(file_existing))
 
     def test_input_linear_mass_json(self):
         '''
         Test mass JSON file input.
         '''
-        json_file = os.path.join(self.test_data_dir, 'hearst1997.json')
-        dataset = input_linear_mass_json(json_file)
+        dataset = input_linear_mass_json(self.HEARST_JSON)
         self.assertEqual(dataset, HEARST_1997_STARGAZER)
 
     def test_input_exception_without_items(self):
@@ -68,8 +69,7 @@ class TestJsonUtils(unittest.TestCase):
         '''
         Test that exceptions occur when given an incorrect file type (TSV).
         '''
-        file_path = os.path.join(self.test_data_dir, 'hearst1997.tsv')
-        self.assertRaises(DataIOError, input_linear_mass_json, file_path)
+        self.assertRaises(DataIOError, input_linear_mass_json, self.HEARST_TSV)
 
     def test_input_exception_bad_type(self):
         '''
@@ -88,10 +88,12 @@ class TestJsonUtils(unittest.TestCase):
         self.assertRaises(DataIOError, input_linear_mass_json, file_path)
 
     def test_input_type_exception(self):
-        file_path_new = os.path.join(
-            self.test_data_dir, 'hearst1997_test.json')
-        __write_json__(file_path_new,
-                       {Field.segmentation_type: 'incorrect',
-                        Field.items: {}})
-        self.assertRaises(DataIOError, input_linear_mass_json, file_path_new)
-        os.remove(file_path_new)
+        fd, file_path_new = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            __write_json__(file_path_new,
+                           {Field.segmentation_type: 'incorrect',
+                            Field.items: {}})
+            self.assertRaises(DataIOError, input_linear_mass_json, file_path_new)
+        finally:
+            os.unlink(file_path_new)
@@ -21,13 +21,13 @@ class TestTsv(unittest.TestCase):
     '''
 
     test_data_dir = pathlib.Path(segeval.data.jsonutils.__file__).parent
+    HEARST_TSV = os.path.join(test_data_dir, 'hearst1997.tsv')
 
     def test_input_linear_mass_tsv(self):
         '''
         Test mass TSV file input.
         '''
-        tsv_file = os.path.join(self.test_data_dir, 'hearst1997.tsv')
-        dataset = input_linear_mass_tsv(tsv_file)
+        dataset = input_linear_mass_tsv(self.HEARST_TSV)
         self.assertEqual(dataset['hearst1997'],
                          HEARST_1997_STARGAZER['stargazer'])
 
@@ -4,6 +4,7 @@ Tests the machine learning (ML) statistics functions, and ml package.
 .. moduleauthor:: Chris Fournier <chris.m.fournier@gmail.com>
 '''
 from __future__ import absolute_import
+import pickle
 import unittest
 from decimal import Decimal
 from segeval.ml import (
@@ -30,6 +31,22 @@ class TestConfusionMatrix(unittest.TestCase):
         self.assertEqual(matrix['p']['f'], 0)
         self.assertEqual(matrix['a']['b'], 0)
 
+    def test_pickle(self):
+        '''
+        Test that a matrix survives a pickle round trip, e.g., when returned
+        from a worker process.
+        '''
+        matrix = cm()
+        matrix['p']['p'] += 2
+        matrix['p']['n'] = 3
+        matrix['n']
+        copy = pickle.loads(pickle.dumps(matrix))
+        self.assertIsInstance(copy, cm)
+        self.assertEqual(copy, matrix)
+        self.assertEqual(copy.classes(), set(['p', 'n']))
+        copy['a']['b'] += 1
+        self.assertEqual(copy.classes(), set(['p', 'n', 'a', 'b']))
+
     def test_setitem(self):
         '''
         Ensure that __setitem__ raises an AttributeError
@@ -139,6 +139,25 @@ class TestBoundary(unittest.TestCase):
                           2),
                          value)
 
+    def test_n_jobs(self):
+        '''
+        Test that comparing coder pairs in worker processes matches serial
+        comparison.
+        '''
+        self.assertEqual(boundary_similarity(HEARST_1997_STARGAZER, n_jobs=2),
+                         boundary_similarity(HEARST_1997_STARGAZER))
+        self.assertEqual(boundary_similarity([2, 3, 6], [2, 2, 7], n_jobs=2),
+                         Decimal('0.75'))
+
+    def test_n_jobs_unpicklable(self):
+        '''
+        Test that metric arguments which cannot be sent to worker processes
+        are reported.
+        '''
+        self.assertRaises(SegmentationMetricError, boundary_similarity,
+                          HEARST_1997_STARGAZER, n_jobs=2,
+                          weight=(lambda additions: 0, weight_s, weight_t))
+
     def test_b_datasets(self):
         '''
         Test B upon two datasets.
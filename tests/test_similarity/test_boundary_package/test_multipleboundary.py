@@ -167,3 +167,16 @@ class TestInnerFncOfMultipleBoundaries(unittest.TestCase):
         d = a_i ^ b_i
 
         self.assertEqual(([(2, 'a'), (3, 'a')], set([(4, 6)])), additions_substitutions_sets(d, a, b))
+
+    def test_additions_substitutions_sets_many_types(self):
+        '''
+        Test ``additions_substitutions_sets`` with more types than could be
+        permuted exhaustively.
+        '''
+        a = set(range(1, 21))
+        b = set([21, 22, 23])
+        d = a ^ b
+
+        added, substituted = additions_substitutions_sets(d, a, b)
+        self.assertEqual(set([(18, 21), (19, 22), (20, 23)]), substituted)
+        self.assertEqual(set((i, 'a') for i in range(1, 18)), set(added))
@@ -137,3 +137,11 @@ class TestSegmentation(unittest.TestCase):
         reference = HEARST_1997_STARGAZER
         value = segmentation_similarity(hypothesis, reference)
         self.assertEqual(value, {})
+
+    def test_n_jobs(self):
+        '''
+        Test that comparing coder pairs in worker processes matches serial
+        comparison.
+        '''
+        self.assertEqual(segmentation_similarity(KAZANTSEVA2012_G5, n_jobs=2),
+                         segmentation_similarity(KAZANTSEVA2012_G5))
@@ -8,7 +8,8 @@ import unittest
 from decimal import Decimal
 from segeval.similarity import boundary_confusion_matrix, boundary_statistics
 from segeval.format import BoundaryFormat
-from segeval.data.samples import HEARST_1997_STARGAZER, HYPOTHESIS_STARGAZER
+from segeval.data.samples import (HEARST_1997_STARGAZER, HYPOTHESIS_STARGAZER,
+                                  KAZANTSEVA2012_G5)
 from segeval.ml import precision, recall, fmeasure
 
 
@@ -89,3 +90,12 @@ class TestSimilarity(unittest.TestCase):
         self.assertAlmostEqual(float(hyp_f['stargazer,h2,1']), 0.58333333)
         self.assertAlmostEqual(float(hyp_f['stargazer,h1,2']), 0.6)
         self.assertAlmostEqual(float(hyp_f['stargazer,h2,2']), 0.5)
+
+    def test_n_jobs(self):
+        '''
+        Test that comparing coder pairs in worker processes matches serial
+        comparison, including confusion matrices returned from workers.
+        '''
+        for fnc_metric in (boundary_statistics, boundary_confusion_matrix):
+            self.assertEqual(fnc_metric(KAZANTSEVA2012_G5, n_jobs=2),
+                             fnc_metric(KAZANTSEVA2012_G5))
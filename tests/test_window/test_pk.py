@@ -370,3 +370,11 @@ class TestPairwisePkMeasure(TestCase):
         self.assertAlmostEqual(float(value['stargazer,h2,1']), 0.36842105)
         self.assertAlmostEqual(float(value['stargazer,h1,2']), 0.42105263)
         self.assertAlmostEqual(float(value['stargazer,h2,2']), 0.42105263)
+
+    def test_n_jobs(self):
+        '''
+        Test that comparing coder pairs in worker processes matches serial
+        comparison.
+        '''
+        self.assertEqual(pk(KAZANTSEVA2012_G5, n_jobs=2),
+                         pk(KAZANTSEVA2012_G5))
@@ -462,3 +462,11 @@ class TestPairwiseWindowDiff(TestCase):
         self.assertAlmostEqual(float(value['stargazer,h2,1']), 0.47368421)
         self.assertAlmostEqual(float(value['stargazer,h1,2']), 0.42105263)
         self.assertAlmostEqual(float(value['stargazer,h2,2']), 0.47368421)
+
+    def test_n_jobs(self):
+        '''
+        Test that comparing coder pairs in worker processes matches serial
+        comparison.
+        '''
+        self.assertEqual(window_diff(KAZANTSEVA2012_G5, n_jobs=2),
+                         window_diff(KAZANTSEVA2012_G5))